@@ -1,13 +1,14 @@
 import customtkinter as ctk
 from CTkMessagebox import CTkMessagebox
 import tkinter as tk
-from tkinter import filedialog, messagebox, simpledialog
+from tkinter import filedialog, messagebox
 import threading
 import os
-import tempfile, json
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
 import plex_utils
 import playlist_io
+import playlist_cache
 
 class PlexPlaylistExporterImporter(ctk.CTk):
     """
@@ -23,8 +24,21 @@ class PlexPlaylistExporterImporter(ctk.CTk):
         super().__init__()
         self.server = None
         self.server_var = tk.StringVar(self)
-        self._threads: list[threading.Thread] = []
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="plex-io")
         self._shutting_down = False
+        # futures submitted through _submit that haven't finished yet; on_close waits for these
+        self._pending: set[Future] = set()
+        self._playlist_by_title: dict = {}
+        self._refresh_in_flight = False
+        self._refresh_pending = False
+        self._export_in_flight = False
+        self._import_in_flight = False
+        self._modify_in_flight = False
+        self._delete_in_flight = False
+        # set by on_close so a running login or import stops instead of holding up shutdown
+        self._connect_cancel_event = threading.Event()
+        self._import_cancel_event: threading.Event | None = None
+        self._playlist_buttons_state = ctk.DISABLED
         self.title("Plex Playlist App")
         # set fixed window size and center on screen
         win_w, win_h = 700, 600
@@ -53,49 +67,192 @@ class PlexPlaylistExporterImporter(ctk.CTk):
         self.status_label = ctk.CTkLabel(self, text="", anchor="center", justify="center")
         self.status_label.grid(row=1, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
 
-        # Tabs for Export/Import
-        self.tabview = ctk.CTkTabview(self)
+        # Tabs for Export/Import/Modify/Delete; contents are built the first time each tab is shown
+        self.tabview = ctk.CTkTabview(self, command=self._on_tab_changed)
         self.tabview.grid(row=2, column=0, columnspan=2, padx=20, pady=20, sticky="nsew")
-        self.tabview.add("Export")
-        self.tabview.add("Import")
-        self.tabview.add("Modify")
-        self.tabview.add("Delete")
-        self.setup_export_tab()
-        self.setup_import_tab()
-        self.setup_modify_tab()
-        self.setup_delete_tab()
-        
+        self._tab_setup = {"Export": self.setup_export_tab, "Import": self.setup_import_tab,
+                           "Modify": self.setup_modify_tab, "Delete": self.setup_delete_tab}
+        self._tab_loaders = {"Export": self.load_playlists, "Modify": self.load_modify_playlists,
+                             "Delete": self.load_delete_playlists}
+        self._tabs_built: set[str] = set()
+        for name in self._tab_setup:
+            self.tabview.add(name)
+        self._on_tab_changed()
+
         # Register graceful shutdown handler
         self.protocol("WM_DELETE_WINDOW", self.on_close)
 
     def on_close(self) -> None:
         """
-        Handler for window close event. Prevents new threads, waits for all background threads to finish, and closes the app.
+        Handler for window close event. Prevents new tasks, cancels a pending login or import,
+        and closes the app once running background tasks have finished.
         """
+        if self._shutting_down:
+            return
         self._shutting_down = True
+        self._connect_cancel_event.set()
+        if self._import_cancel_event is not None:
+            self._import_cancel_event.set()
         self.connect_btn.configure(state=ctk.DISABLED)
         self.status_label.configure(text="Shutting down, please wait...")
-        # Wait for all threads to finish (with timeout)
-        for t in self._threads:
-            if t.is_alive():
-                t.join(timeout=5)
+        # Drop queued tasks without blocking; the event loop keeps running so workers calling after() aren't stuck
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._destroy_when_idle()
+
+    def _destroy_when_idle(self) -> None:
+        """
+        Destroy the window once every submitted task has finished, checking again every 100 ms until then.
+        """
+        if any(not fut.done() for fut in self._pending.copy()):
+            self.after(100, self._destroy_when_idle)
+            return
         self.destroy()
         # Do not call any Tkinter methods after self.destroy() to avoid TclError
-        return  # End of shutdown logic; all UI setup belongs in __init__
 
-        # Tabs for Export/Import
-        self.tabview = ctk.CTkTabview(self)
-        self.tabview.grid(row=2, column=0, columnspan=2, padx=20, pady=20, sticky="nsew")
-        self.tabview.add("Export")
-        self.tabview.add("Import")
-        self.tabview.add("Modify")
-        self.setup_export_tab()
-        self.setup_import_tab()
-        self.setup_modify_tab()
+    def _on_tab_changed(self) -> None:
+        """
+        Build the contents of the selected tab the first time it is shown, filling it from the current playlist list.
+        """
+        name = self.tabview.get()
+        if name in self._tabs_built:
+            return
+        self._tab_setup[name]()
+        self._tabs_built.add(name)
+        loader = self._tab_loaders.get(name)
+        if loader is not None and self.server and hasattr(self, "playlists"):
+            loader()
+
+    def _load_built_tabs(self) -> None:
+        """
+        Reload the playlist list in every tab that has been built so far.
+        """
+        for name, loader in self._tab_loaders.items():
+            if name in self._tabs_built:
+                loader()
+
+    def _submit(self, fn, on_done=None) -> Future | None:
+        """
+        Run a function on the shared worker pool.
+
+        Args:
+            fn (callable): Function to run in the background.
+            on_done (callable, optional): Called with the finished future on the Tk main thread.
+
+        Returns:
+            Future | None: The submitted future, or None if the app is shutting down.
+        """
+        if self._shutting_down:
+            return None
+        fut = self._executor.submit(fn)
+        self._pending.add(fut)
+        fut.add_done_callback(self._pending.discard)
+        if on_done is not None:
+            def _dispatch(f):
+                if not f.cancelled() and not self._shutting_down:
+                    self.after(0, on_done, f)
+            fut.add_done_callback(_dispatch)
+        return fut
+
+    def _set_playlists(self, pls: list) -> None:
+        """
+        Store the fetched playlists and rebuild the title lookup.
+
+        Args:
+            pls (list): List of Plex playlist objects.
+        """
+        self.playlists = pls
+        self._playlist_by_title = {pl.title: pl for pl in pls}
+
+    def _populate_pool(self, pool: list, frame: ctk.CTkFrame, widget_cls: type, rows: list) -> None:
+        """
+        Show one widget per row in a frame, reusing pooled widgets and only creating new ones when the pool runs out.
+        Widgets beyond the number of rows are hidden rather than destroyed.
+
+        Args:
+            pool (list): Widgets previously created for this frame.
+            frame (ctk.CTkFrame): Parent frame for newly created widgets.
+            widget_cls (type): CTk widget class to instantiate when the pool is too small.
+            rows (list): Keyword arguments to configure each visible widget with.
+        """
+        for i, kwargs in enumerate(rows):
+            if i < len(pool):
+                pool[i].configure(**kwargs)
+            else:
+                pool.append(widget_cls(frame, **kwargs))
+            pool[i].grid(row=i, column=0, sticky="w")
+        for w in pool[len(rows):]:
+            w.grid_forget()
+
+    def _populate_radios(self, pool: dict, frame: ctk.CTkFrame, variable: tk.StringVar, values: list) -> None:
+        """
+        Show one radio button per value, labelled with the value.
+        CTkRadioButton can't change its value once created, so buttons are pooled by value: a value shown before
+        reuses its button, new values get new buttons, and buttons for values no longer listed are destroyed.
+
+        Args:
+            pool (dict): Radio buttons previously created for this frame, keyed by value.
+            frame (ctk.CTkFrame): Parent frame for newly created buttons.
+            variable (tk.StringVar): Variable shared by the radio buttons.
+            values (list): Values to show, in display order.
+        """
+        for value in pool.keys() - set(values):
+            pool.pop(value).destroy()
+        # a value can only have one button, so duplicates (e.g. two playlists with the same title) are shown once
+        for i, value in enumerate(dict.fromkeys(values)):
+            rb = pool.get(value)
+            if rb is None:
+                rb = pool[value] = ctk.CTkRadioButton(frame, text=value, variable=variable, value=value)
+            rb.grid(row=i, column=0, sticky="w")
+
+    def _set_playlist_buttons_state(self, state: str) -> None:
+        """
+        Enable or disable every button that depends on the playlist list.
+        Tabs built later pick up the same state when they are created.
+
+        Args:
+            state (str): ctk.NORMAL or ctk.DISABLED.
+        """
+        self._playlist_buttons_state = state
+        for attr in ("export_refresh_btn", "export_selected_btn", "import_selected_btn",
+                     "modify_refresh_btn", "modify_selected_btn",
+                     "delete_refresh_btn", "delete_selected_btn"):
+            btn = getattr(self, attr, None)
+            if btn is not None:
+                btn.configure(state=state)
+
+    def _refresh_all_playlists(self) -> None:
+        """
+        Re-fetch playlists from Plex once and reload the Export, Modify and Delete tabs.
+        If a refresh is already running, another one is queued to run after it instead of fetching in parallel.
+        """
+        if self._refresh_in_flight:
+            self._refresh_pending = True
+            return
+        self._refresh_in_flight = True
+        self._set_playlist_buttons_state(ctk.DISABLED)
+        self._playlist_by_title = {}
+        server = self.server
+        def task():
+            try:
+                pls = plex_utils.get_playlists(server)
+            except Exception:
+                return []
+            playlist_cache.save_cache(server.machineIdentifier, [pl.title for pl in pls])
+            return pls
+        def done(fut):
+            self._refresh_in_flight = False
+            self._set_playlists(fut.result())
+            self._load_built_tabs()
+            self._set_playlist_buttons_state(ctk.NORMAL)
+            if self._refresh_pending:
+                self._refresh_pending = False
+                self._refresh_all_playlists()
+        if self._submit(task, done) is None:
+            self._refresh_in_flight = False
 
     def connect_to_plex(self) -> None:
         """
-        Initiate connection to Plex server using a background thread.
+        Initiate connection to Plex server using the background worker pool.
         Disables the connect button and updates status label during the process.
         """
         # disable connect button, then after 5s show waiting status
@@ -103,49 +260,53 @@ class PlexPlaylistExporterImporter(ctk.CTk):
         self.status_label.configure(text="")
         self.after(5000, lambda: self.status_label.configure(text="Awaiting access... please be patient, this can take up to one minute"))
         def task():
+            server = plex_utils.login_to_plex(cancel_event=self._connect_cancel_event)
+            return server, server.friendlyName, playlist_cache.load_cached(server.machineIdentifier)
+        def done(fut):
             try:
-                server = plex_utils.login_to_plex()
-                name = server.friendlyName
-                # update UI on main thread
-                self.after(0, lambda: self._on_connect_success(server, name))
+                server, name, cached_titles = fut.result()
             except Exception as e:
-                self.after(0, lambda: self._on_connect_error(e))
-        threading.Thread(target=task, daemon=True).start()
+                self._on_connect_error(e)
+            else:
+                self._on_connect_success(server, name, cached_titles)
+        self._submit(task, done)
 
-    def _on_connect_success(self, server: object, name: str) -> None:
+    def _on_connect_success(self, server: object, name: str, cached_titles: list | None) -> None:
         """
         Callback for successful Plex connection. Updates UI accordingly.
+        Shows playlist titles cached from the last session straight away, then fetches the live list in the background.
 
         Args:
             server (object): Connected Plex server instance.
             name (str): Server friendly name.
+            cached_titles (list | None): Playlist titles cached for this server, if any.
         """
         self.server = server
         self.server_var.set(name)
         self.server_menu.configure(values=[name])
         self.status_label.configure(text=f"Connected to Plex: {name}")
         self.connect_btn.configure(state=ctk.DISABLED)
-        # Fetch all playlists and store in self.playlists
-        try:
-            self.export_refresh_btn.configure(state=ctk.DISABLED)
-            self.modify_refresh_btn.configure(state=ctk.DISABLED)
-            self.export_selected_btn.configure(state=ctk.DISABLED)
-            self.import_selected_btn.configure(state=ctk.DISABLED)
-            self.modify_selected_btn.configure(state=ctk.DISABLED)
-            self.playlists = plex_utils.get_playlists(self.server)
-        except Exception as e:
-            self.playlists = []
-        # Prepopulate Export and Modify tabs
-        self.load_playlists()
-        self.load_modify_playlists()
-        self.load_delete_playlists()
-        self.export_refresh_btn.configure(state=ctk.NORMAL)
-        self.modify_refresh_btn.configure(state=ctk.NORMAL)
-        self.export_selected_btn.configure(state=ctk.NORMAL)
-        self.import_selected_btn.configure(state=ctk.NORMAL)
-        self.modify_selected_btn.configure(state=ctk.NORMAL)
-        self.delete_refresh_btn.configure(state=ctk.NORMAL)
-        self.delete_selected_btn.configure(state=ctk.NORMAL)
+        if cached_titles:
+            self._show_cached_titles(cached_titles)
+        # Prepopulate Export, Modify and Delete tabs with the live list
+        self._refresh_all_playlists()
+
+    def _show_cached_titles(self, titles: list) -> None:
+        """
+        Fill the built Export, Modify and Delete tabs with cached playlist titles as a placeholder.
+        The playlist buttons stay disabled until the live list replaces these rows.
+
+        Args:
+            titles (list): Cached playlist titles.
+        """
+        if "Export" in self._tabs_built:
+            self._populate_pool(self._export_checkbox_pool, self.playlist_frame, ctk.CTkCheckBox,
+                                [{"text": t, "variable": tk.BooleanVar()} for t in titles])
+        if "Modify" in self._tabs_built:
+            self._populate_radios(self._modify_radio_pool, self.modify_frame, self.modify_var, titles)
+        if "Delete" in self._tabs_built:
+            self._populate_pool(self._delete_checkbox_pool, self.delete_frame, ctk.CTkCheckBox,
+                                [{"text": t, "variable": tk.BooleanVar()} for t in titles])
 
     def _on_connect_error(self, error: Exception) -> None:
         """
@@ -167,75 +328,46 @@ class PlexPlaylistExporterImporter(ctk.CTk):
         frame.grid_columnconfigure(0, weight=1)
         frame.grid_columnconfigure(1, weight=0)
         frame.grid_rowconfigure(1, weight=1)
-        self.export_refresh_btn = ctk.CTkButton(frame, text="Refresh Playlists", command=self._refresh_export_playlists, state=ctk.DISABLED)
+        self.export_refresh_btn = ctk.CTkButton(frame, text="Refresh Playlists", command=self._refresh_all_playlists, state=self._playlist_buttons_state)
         self.export_refresh_btn.grid(row=0, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
         self.playlist_frame = ctk.CTkFrame(frame)
         self.playlist_frame.grid(row=1, column=0, columnspan=2, padx=10, pady=10, sticky="nsew")
         self.playlist_vars = {}
-        self.export_selected_btn = ctk.CTkButton(frame, text="Export Selected", command=self.export_playlists, state=ctk.DISABLED)
+        self._export_checkbox_pool: list[ctk.CTkCheckBox] = []
+        self.export_selected_btn = ctk.CTkButton(frame, text="Export Selected", command=self.export_playlists, state=self._playlist_buttons_state)
         self.export_selected_btn.grid(row=2, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
 
-    def _refresh_export_playlists(self):
-        self.export_refresh_btn.configure(state=ctk.DISABLED)
-        self.export_selected_btn.configure(state=ctk.DISABLED)
-        self.import_selected_btn.configure(state=ctk.DISABLED)
-        self.modify_selected_btn.configure(state=ctk.DISABLED)
-        def task():
-            try:
-                self.playlists = plex_utils.get_playlists(self.server)
-            except Exception:
-                self.playlists = []
-            self.after(0, self.load_playlists)
-            self.after(0, lambda: self.export_refresh_btn.configure(state=ctk.NORMAL))
-            self.after(0, lambda: self.export_selected_btn.configure(state=ctk.NORMAL))
-            self.after(0, lambda: self.import_selected_btn.configure(state=ctk.NORMAL))
-            self.after(0, lambda: self.modify_selected_btn.configure(state=ctk.NORMAL))
-        threading.Thread(target=task, daemon=True).start()
-
-    def _refresh_modify_playlists(self):
-        self.modify_refresh_btn.configure(state=ctk.DISABLED)
-        self.export_selected_btn.configure(state=ctk.DISABLED)
-        self.import_selected_btn.configure(state=ctk.DISABLED)
-        self.modify_selected_btn.configure(state=ctk.DISABLED)
-        def task():
-            try:
-                self.playlists = plex_utils.get_playlists(self.server)
-            except Exception:
-                self.playlists = []
-            self.after(0, self.load_modify_playlists)
-            self.after(0, lambda: self.modify_refresh_btn.configure(state=ctk.NORMAL))
-            self.after(0, lambda: self.export_selected_btn.configure(state=ctk.NORMAL))
-            self.after(0, lambda: self.import_selected_btn.configure(state=ctk.NORMAL))
-            self.after(0, lambda: self.modify_selected_btn.configure(state=ctk.NORMAL))
-        threading.Thread(target=task, daemon=True).start()
     def load_playlists(self) -> None:
         """
         Load playlists from the connected Plex server and populate the export selection list.
         Shows error if not connected.
         """
-        for w in self.playlist_frame.winfo_children():
-            w.destroy()
         if not self.server:
+            self._populate_pool(self._export_checkbox_pool, self.playlist_frame, ctk.CTkCheckBox, [])
             CTkMessagebox(title="Error", message="Not connected to Plex")
             return
         pls = getattr(self, 'playlists', None)
         if pls is None:
             pls = plex_utils.get_playlists(self.server)
-            self.playlists = pls
+            self._set_playlists(pls)
         self.playlist_vars = {}
-        for i, pl in enumerate(pls):
+        rows = []
+        for pl in pls:
             var = tk.BooleanVar()
-            ctk.CTkCheckBox(self.playlist_frame, text=pl.title, variable=var).grid(row=i, column=0, sticky="w")
+            rows.append({"text": pl.title, "variable": var})
             self.playlist_vars[pl.title] = (var, pl)
+        self._populate_pool(self._export_checkbox_pool, self.playlist_frame, ctk.CTkCheckBox, rows)
 
 
 
 
     def export_playlists(self) -> None:
         """
-        Export selected playlists to a JSON file using a background thread.
+        Export selected playlists to a JSON file using the background worker pool.
         Shows error if no playlists are selected.
         """
+        if self._export_in_flight:
+            return
         selected = [(name, pl) for name, (var, pl) in self.playlist_vars.items() if var.get()]
         if not selected:
             CTkMessagebox(title="Error", message="No playlists selected")
@@ -246,12 +378,18 @@ class PlexPlaylistExporterImporter(ctk.CTk):
         if not path:
             return
         def task():
+            playlist_io.export_to_json(self.server, [pl for _, pl in selected], path)
+        def done(fut):
+            self._export_in_flight = False
+            self.export_selected_btn.configure(state=ctk.NORMAL)
             try:
-                playlist_io.export_to_json(self.server, [pl for _, pl in selected], path)
-                CTkMessagebox(title="Success", message="Export completed")
+                fut.result()
             except Exception as e:
                 CTkMessagebox(title="Error", message=str(e))
-        threading.Thread(target=task, daemon=True).start()
+            else:
+                CTkMessagebox(title="Success", message="Export completed")
+        self.export_selected_btn.configure(state=ctk.DISABLED)
+        self._export_in_flight = self._submit(task, done) is not None
 
     def setup_import_tab(self) -> None:
         """
@@ -268,8 +406,9 @@ class PlexPlaylistExporterImporter(ctk.CTk):
         self.import_frame = ctk.CTkFrame(frame)
         self.import_frame.grid(row=2, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
         self.import_vars = {}
+        self._import_widgets: list = []
         self.file_path = None
-        self.import_selected_btn = ctk.CTkButton(frame, text="Import Selected", command=self.import_playlists, state=ctk.DISABLED)
+        self.import_selected_btn = ctk.CTkButton(frame, text="Import Selected", command=self.import_playlists, state=self._playlist_buttons_state)
         self.import_selected_btn.grid(row=3, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
 
     def browse_file(self) -> None:
@@ -283,17 +422,20 @@ class PlexPlaylistExporterImporter(ctk.CTk):
         self.file_path = path
         self.file_label.configure(text=os.path.basename(path))
         names = playlist_io.preview_import(path)
-        for w in self.import_frame.winfo_children():
+        for w in self._import_widgets:
             w.destroy()
+        self._import_widgets.clear()
         self.import_vars.clear()
         if not names:
             return
         for i, name in enumerate(names):
             sel_var = tk.BooleanVar(value=True)
-            ctk.CTkCheckBox(self.import_frame, text=name, variable=sel_var).grid(row=i, column=0, sticky="w")
+            cb = ctk.CTkCheckBox(self.import_frame, text=name, variable=sel_var)
+            cb.grid(row=i, column=0, sticky="w")
             new_name_var = tk.StringVar(value=name)
             entry = ctk.CTkEntry(self.import_frame, textvariable=new_name_var, width=200)
             entry.grid(row=i, column=1, padx=10, pady=2, sticky="ew")
+            self._import_widgets.extend((cb, entry))
             self.import_vars[name] = (sel_var, new_name_var)
         # allow entry column to expand
         self.import_frame.grid_columnconfigure(1, weight=1)
@@ -304,8 +446,10 @@ class PlexPlaylistExporterImporter(ctk.CTk):
         """
         Import selected playlists from the chosen file into Plex.
         Handles playlist renaming and conflict resolution.
-        Runs import in a background thread for UI responsiveness.
+        Runs import on the background worker pool for UI responsiveness.
         """
+        if self._import_in_flight:
+            return
         if not self.file_path:
             CTkMessagebox(title="Error", message="No file selected")
             return
@@ -317,35 +461,22 @@ class PlexPlaylistExporterImporter(ctk.CTk):
         if not rename_map:
             CTkMessagebox(title="Error", message="No playlists selected")
             return
-        # resolve conflicts with existing playlists
-        existing_titles = [pl.title for pl in self.server.playlists()]
-        for original in list(rename_map.keys()):
-            new_name = rename_map[original]
-            if new_name in existing_titles:
-                # ask user to delete existing or rename import
-                delete = messagebox.askyesno(
-                    "Playlist Exists",
-                    f"Playlist '{new_name}' already exists. Delete existing and import under same name? (No = rename imported)"
-                )
-                if delete:
-                    try:
-                        existing = next(pl for pl in self.server.playlists() if pl.title == new_name)
-                        existing.delete()
-                    except Exception as e:
-                        CTkMessagebox(title="Error", message=f"Failed to delete existing playlist: {e}")
-                        return
+        # resolve conflicts against the cached playlist list in a single dialog; no server round-trip here
+        existing_titles = self._playlist_by_title
+        conflicts = {original: new_name for original, new_name in rename_map.items() if new_name in existing_titles}
+        # existing playlists to delete before importing, keyed by title so a shared target is deleted once
+        to_replace = {}
+        if conflicts:
+            actions = self._ask_conflict_actions(conflicts)
+            if actions is None:
+                return
+            for original, (action, name) in actions.items():
+                if action == "Replace":
+                    to_replace[conflicts[original]] = existing_titles[conflicts[original]]
+                elif action == "Rename" and name:
+                    rename_map[original] = name
                 else:
-                    # prompt for new name
-                    new_name_prompt = simpledialog.askstring(
-                        "Rename Playlist",
-                        f"Enter new name for imported playlist (was '{new_name}'):",
-                        initialvalue=new_name
-                    )
-                    if not new_name_prompt:
-                        # skip this playlist
-                        rename_map.pop(original)
-                        continue
-                    rename_map[original] = new_name_prompt
+                    rename_map.pop(original)
         if not rename_map:
             CTkMessagebox(title="Error", message="No playlists to import after resolving conflicts")
             return
@@ -369,146 +500,200 @@ class PlexPlaylistExporterImporter(ctk.CTk):
         cancel_btn = ctk.CTkButton(progress_dialog, text="Cancel Import", command=cancel_event.set)
         cancel_btn.pack(pady=10)
         def update_progress(current, total):
+            # once closing, the Tk thread is blocked in on_close and can't service after()
+            if self._shutting_down:
+                return
             percent = current / total if total else 0
-            self.after(0, lambda: progress_bar.set(percent))
-            self.after(0, lambda: progress_label.configure(text=f"Importing... {current} / {total}"))
+            def _update():
+                progress_bar.set(percent)
+                progress_label.configure(text=f"Importing... {current} / {total}")
+            self.after(0, _update)
         def run_import():
+            for existing in to_replace.values():
+                try:
+                    existing.delete()
+                except Exception as e:
+                    raise Exception(f"Failed to delete existing playlist: {e}")
+            res = playlist_io.import_from_file(self.server, self.file_path, rename_map, progress_callback=update_progress, cancel_event=cancel_event)
+            # Check if Missing Movies.json was created and append explanation if so
+            missing_path = os.path.join(os.getcwd(), "Missing Movies.json")
+            extra_msg = ""
             try:
-                res = playlist_io.import_from_file(self.server, self.file_path, rename_map, progress_callback=update_progress, cancel_event=cancel_event)
-                # Check if Missing Movies.json was created and append explanation if so
-                missing_path = os.path.join(os.getcwd(), "Missing Movies.json")
-                extra_msg = ""
-                if os.path.exists(missing_path):
-                    try:
-                        with open(missing_path, "r", encoding="utf-8") as f:
-                            import json as _json
-                            try:
-                                missing_list = _json.load(f)
-                            except Exception:
-                                missing_list = []
-                        if missing_list:
-                            extra_msg = ("\n\nSome movies were not imported because they were not found on your Plex server. "
-                                         "A list of missing movies has been saved as 'Missing Movies.json'.")
-                        else:
-                            os.remove(missing_path)
-                    except Exception:
-                        pass
-                def show_results_and_focus():
-                    CTkMessagebox(title="Import Results", message=res + extra_msg)
-                    self.focus_force()
-                self.after(0, show_results_and_focus)
-                self.after(0, self._refresh_export_playlists)
-                self.after(0, self._refresh_modify_playlists)
-                self.after(0, self._refresh_delete_playlists)
+                # a missing file raises OSError and is skipped
+                missing_list = playlist_io.load_missing_movies(missing_path)
+                if missing_list:
+                    extra_msg = ("\n\nSome movies were not imported because they were not found on your Plex server. "
+                                 "A list of missing movies has been saved as 'Missing Movies.json'.")
+                else:
+                    os.remove(missing_path)
+            except OSError:
+                pass
+            return res + extra_msg
+        def done(fut):
+            # one callback for all UI cleanup so Tk handles it in a single pass
+            self._import_in_flight = False
+            self._import_cancel_event = None
+            self.import_selected_btn.configure(state=ctk.NORMAL)
+            progress_dialog.destroy()
+            self.attributes('-disabled', False)
+            try:
+                message = fut.result()
             except Exception as e:
-                self.after(0, lambda: CTkMessagebox(title="Error", message=str(e)))
-            finally:
-                self.after(0, lambda: progress_dialog.destroy())
-                self.after(0, lambda: self.attributes('-disabled', False))
-        threading.Thread(target=run_import, daemon=True).start()
+                CTkMessagebox(title="Error", message=str(e))
+                return
+            CTkMessagebox(title="Import Results", message=message)
+            self.focus_force()
+            self._refresh_all_playlists()
+        self.import_selected_btn.configure(state=ctk.DISABLED)
+        self._import_in_flight = True
+        self._import_cancel_event = cancel_event
+        if self._submit(run_import, done) is None:
+            self._import_in_flight = False
+            self._import_cancel_event = None
+            progress_dialog.destroy()
+            self.attributes('-disabled', False)
+
+    def _ask_conflict_actions(self, conflicts: dict) -> dict | None:
+        """
+        Show one dialog listing every import whose target name already exists on the server.
+        Each row lets the user replace the existing playlist, import under a new name, or skip it.
+
+        Args:
+            conflicts (dict): Mapping of original playlist names to their conflicting target names.
+
+        Returns:
+            dict | None: Mapping of original names to (action, name) tuples, or None if the user cancelled.
+        """
+        dialog = ctk.CTkToplevel(self)
+        dialog.title("Playlists Already Exist")
+        dialog.geometry("600x400")
+        dialog.grab_set()  # Modal
+        dialog.attributes('-topmost', True)
+        dialog.grid_columnconfigure(0, weight=1)
+        dialog.grid_rowconfigure(1, weight=1)
+        ctk.CTkLabel(dialog, text="These playlists already exist on your Plex server. Choose what to do with each:").grid(row=0, column=0, padx=10, pady=(10, 5), sticky="w")
+        rows_frame = ctk.CTkScrollableFrame(dialog)
+        rows_frame.grid(row=1, column=0, padx=10, pady=5, sticky="nsew")
+        rows_frame.grid_columnconfigure(2, weight=1)
+        rows = {}
+        for i, (original, new_name) in enumerate(conflicts.items()):
+            ctk.CTkLabel(rows_frame, text=new_name).grid(row=i, column=0, padx=5, pady=2, sticky="w")
+            action_var = tk.StringVar(value="Skip")
+            ctk.CTkSegmentedButton(rows_frame, values=["Replace", "Rename", "Skip"], variable=action_var).grid(row=i, column=1, padx=5, pady=2)
+            name_var = tk.StringVar(value=new_name)
+            ctk.CTkEntry(rows_frame, textvariable=name_var, width=180).grid(row=i, column=2, padx=5, pady=2, sticky="ew")
+            rows[original] = (action_var, name_var)
+        result = {}
+        def confirm():
+            result.update({original: (action_var.get(), name_var.get().strip()) for original, (action_var, name_var) in rows.items()})
+            dialog.destroy()
+        buttons = ctk.CTkFrame(dialog, fg_color="transparent")
+        buttons.grid(row=2, column=0, pady=10)
+        ctk.CTkButton(buttons, text="Continue", command=confirm).pack(side="left", padx=5)
+        ctk.CTkButton(buttons, text="Cancel Import", command=dialog.destroy).pack(side="left", padx=5)
+        self.wait_window(dialog)
+        return result or None
 
     def setup_modify_tab(self):
         frame = self.tabview.tab("Modify")
         frame.grid_columnconfigure(0, weight=1)
         frame.grid_columnconfigure(1, weight=1)
         frame.grid_rowconfigure(1, weight=1)  # Make row 1 (the playlist frame) expand
-        self.modify_refresh_btn = ctk.CTkButton(frame, text="Refresh Playlists", command=self._refresh_modify_playlists, state=ctk.DISABLED)
+        self.modify_refresh_btn = ctk.CTkButton(frame, text="Refresh Playlists", command=self._refresh_all_playlists, state=self._playlist_buttons_state)
         self.modify_refresh_btn.grid(row=0, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
         self.modify_frame = ctk.CTkFrame(frame)
         self.modify_frame.grid(row=1, column=0, columnspan=2, padx=10, pady=10, sticky="nsew")
         self.modify_var = tk.StringVar()
-        self.modify_selected_btn = ctk.CTkButton(frame, text="Modify Playlist to Sort by Year", command=self.modify_playlist, state=ctk.DISABLED)
+        self._modify_radio_pool: dict[str, ctk.CTkRadioButton] = {}
+        self.modify_selected_btn = ctk.CTkButton(frame, text="Modify Playlist to Sort by Year", command=self.modify_playlist, state=self._playlist_buttons_state)
         self.modify_selected_btn.grid(row=2, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
 
     def load_modify_playlists(self):
-        for w in self.modify_frame.winfo_children():
-            w.destroy()
         if not self.server:
+            self._populate_radios(self._modify_radio_pool, self.modify_frame, self.modify_var, [])
             CTkMessagebox(title="Error", message="Not connected to Plex")
             return
         pls = getattr(self, 'playlists', None)
         if pls is None:
             pls = plex_utils.get_playlists(self.server)
-            self.playlists = pls
-        for i, pl in enumerate(pls):
-            ctk.CTkRadioButton(self.modify_frame, text=pl.title, variable=self.modify_var, value=pl.title).grid(row=i, column=0, sticky="w")
+            self._set_playlists(pls)
+        self._populate_radios(self._modify_radio_pool, self.modify_frame, self.modify_var, [pl.title for pl in pls])
 
     def modify_playlist(self):
+        """
+        Re-create the selected playlist with its items sorted by year, then title.
+        Runs on the background worker pool so the UI stays responsive.
+        """
+        if self._modify_in_flight:
+            return
         selected = self.modify_var.get()
         if not selected:
             CTkMessagebox(title="Error", message="No playlist selected")
             return
-        pls = plex_utils.get_playlists(self.server)
-        pl = next((p for p in pls if p.title == selected), None)
+        pl = self._playlist_by_title.get(selected)
         if not pl:
             CTkMessagebox(title="Error", message="Playlist not found")
             return
-        tf = tempfile.NamedTemporaryFile(delete=False, suffix=".json")
-        tf.close()
-        path = tf.name
-        playlist_io.export_to_json(self.server, [pl], path)
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        items = data["playlists"][0]["items"]
-        items.sort(key=lambda x: ((x.get("year") or 0), x.get("title", "")))
-        data["playlists"][0]["items"] = items
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-        try:
-            pl.delete()
-        except Exception as e:
-            CTkMessagebox(title="Error", message=f"Failed to delete original playlist: {e}")
-            return
-        res = playlist_io.import_from_file(self.server, path, {selected: selected})
-        CTkMessagebox(title="Playlist Modified", message=f"Playlist '{selected}' sorted by year and updated on Plex server successfully.")
-        try:
-            os.remove(path)
-        except OSError:
-            pass
+        def task():
+            data = playlist_io.export_to_dict(self.server, [pl])
+            items = data["playlists"][0]["items"]
+            # decorate once so each item's keys are read a single time; index breaks ties without comparing dicts
+            decorated = [((it.get("year") or 0, it.get("title") or ""), i, it) for i, it in enumerate(items)]
+            decorated.sort()
+            items[:] = [it for _, _, it in decorated]
+            try:
+                pl.delete()
+            except Exception as e:
+                raise Exception(f"Failed to delete original playlist: {e}")
+            return playlist_io.import_from_dict(self.server, data, {selected: selected})
+        def done(fut):
+            self._modify_in_flight = False
+            self.modify_selected_btn.configure(state=ctk.NORMAL)
+            try:
+                fut.result()
+            except Exception as e:
+                CTkMessagebox(title="Error", message=str(e))
+                return
+            CTkMessagebox(title="Playlist Modified", message=f"Playlist '{selected}' sorted by year and updated on Plex server successfully.")
+            # the playlist was recreated, so cached playlist objects are stale
+            self._refresh_all_playlists()
+        self.modify_selected_btn.configure(state=ctk.DISABLED)
+        self._modify_in_flight = self._submit(task, done) is not None
 
     def setup_delete_tab(self):
         frame = self.tabview.tab("Delete")
         frame.grid_columnconfigure(0, weight=1)
         frame.grid_columnconfigure(1, weight=1)
         frame.grid_rowconfigure(1, weight=1)
-        self.delete_refresh_btn = ctk.CTkButton(frame, text="Refresh Playlists", command=self._refresh_delete_playlists, state=ctk.DISABLED)
+        self.delete_refresh_btn = ctk.CTkButton(frame, text="Refresh Playlists", command=self._refresh_all_playlists, state=self._playlist_buttons_state)
         self.delete_refresh_btn.grid(row=0, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
         self.delete_frame = ctk.CTkFrame(frame)
         self.delete_frame.grid(row=1, column=0, columnspan=2, padx=10, pady=10, sticky="nsew")
         self.delete_vars = {}
-        self.delete_selected_btn = ctk.CTkButton(frame, text="Delete Selected Playlists from Plex Server", command=self.delete_selected_playlists, state=ctk.DISABLED)
+        self._delete_checkbox_pool: list[ctk.CTkCheckBox] = []
+        self.delete_selected_btn = ctk.CTkButton(frame, text="Delete Selected Playlists from Plex Server", command=self.delete_selected_playlists, state=self._playlist_buttons_state)
         self.delete_selected_btn.grid(row=2, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
 
-    def _refresh_delete_playlists(self):
-        self.delete_refresh_btn.configure(state=ctk.DISABLED)
-        self.delete_selected_btn.configure(state=ctk.DISABLED)
-        def task():
-            try:
-                self.playlists = plex_utils.get_playlists(self.server)
-            except Exception:
-                self.playlists = []
-            self.after(0, self.load_delete_playlists)
-            self.after(0, lambda: self.delete_refresh_btn.configure(state=ctk.NORMAL))
-            self.after(0, lambda: self.delete_selected_btn.configure(state=ctk.NORMAL))
-        threading.Thread(target=task, daemon=True).start()
-
     def load_delete_playlists(self):
-        for w in self.delete_frame.winfo_children():
-            w.destroy()
         if not self.server:
+            self._populate_pool(self._delete_checkbox_pool, self.delete_frame, ctk.CTkCheckBox, [])
             CTkMessagebox(title="Error", message="Not connected to Plex")
             return
         pls = getattr(self, 'playlists', None)
         if pls is None:
             pls = plex_utils.get_playlists(self.server)
-            self.playlists = pls
+            self._set_playlists(pls)
         self.delete_vars = {}
-        for i, pl in enumerate(pls):
+        rows = []
+        for pl in pls:
             var = tk.BooleanVar()
-            ctk.CTkCheckBox(self.delete_frame, text=pl.title, variable=var).grid(row=i, column=0, sticky="w")
+            rows.append({"text": pl.title, "variable": var})
             self.delete_vars[pl.title] = (var, pl)
+        self._populate_pool(self._delete_checkbox_pool, self.delete_frame, ctk.CTkCheckBox, rows)
 
     def delete_selected_playlists(self):
+        if self._delete_in_flight:
+            return
         selected = [(name, pl) for name, (var, pl) in self.delete_vars.items() if var.get()]
         if not selected:
             CTkMessagebox(title="Error", message="No playlists selected")
@@ -517,19 +702,26 @@ class PlexPlaylistExporterImporter(ctk.CTk):
             return
         def task():
             errors = []
-            for name, pl in selected:
-                try:
-                    pl.delete()
-                except Exception as e:
-                    errors.append(f"{name}: {e}")
+            # deletes are independent requests; overlap them, capped to stay polite to the server
+            with ThreadPoolExecutor(max_workers=8) as ex:
+                futs = {ex.submit(pl.delete): name for name, pl in selected}
+                for f in as_completed(futs):
+                    try:
+                        f.result()
+                    except Exception as e:
+                        errors.append(f"{futs[f]}: {e}")
+            return errors
+        def done(fut):
+            self._delete_in_flight = False
+            self.delete_selected_btn.configure(state=ctk.NORMAL)
+            errors = fut.result()
             if errors:
-                self.after(0, lambda: CTkMessagebox(title="Delete Results", message="Some playlists could not be deleted:\n" + "\n".join(errors)))
+                CTkMessagebox(title="Delete Results", message="Some playlists could not be deleted:\n" + "\n".join(errors))
             else:
-                self.after(0, lambda: CTkMessagebox(title="Delete Results", message="Selected playlists deleted successfully."))
-            self.after(0, self._refresh_export_playlists)
-            self.after(0, self._refresh_modify_playlists)
-            self.after(0, self._refresh_delete_playlists)
-        threading.Thread(target=task, daemon=True).start()
+                CTkMessagebox(title="Delete Results", message="Selected playlists deleted successfully.")
+            self._refresh_all_playlists()
+        self.delete_selected_btn.configure(state=ctk.DISABLED)
+        self._delete_in_flight = self._submit(task, done) is not None
 
 def main():
     app = PlexPlaylistExporterImporter()
@@ -0,0 +1,28 @@
+import os
+from contextlib import contextmanager
+
+@contextmanager
+def atomic_write(file_path: str, mode: str = "w", **open_kwargs):
+    """
+    Open a temporary file next to file_path for writing and move it over file_path once the block finishes.
+    If the block raises, the temporary file is removed and file_path is left untouched, so readers never see a partial file.
+
+    Args:
+        file_path (str): Path of the file to write.
+        mode (str): Mode to open the temporary file with. Default is "w".
+        **open_kwargs: Further arguments for open(), e.g. encoding or buffering.
+
+    Yields:
+        file: The open temporary file.
+    """
+    tmp_path = file_path + ".tmp"
+    try:
+        with open(tmp_path, mode, **open_kwargs) as f:
+            yield f
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
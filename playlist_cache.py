@@ -0,0 +1,97 @@
+import json
+import os
+from file_utils import atomic_write
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".plexplaylistapp")
+
+def _cache_path(machine_id: str) -> str:
+    """
+    Return the cache file path for a Plex server.
+
+    Args:
+        machine_id (str): The server's machineIdentifier.
+
+    Returns:
+        str: Path to the server's cache file.
+    """
+    return os.path.join(CACHE_DIR, f"{machine_id}.json")
+
+def load_cached(machine_id: str) -> list | None:
+    """
+    Load the playlist titles cached for a Plex server on a previous run.
+
+    Args:
+        machine_id (str): The server's machineIdentifier.
+
+    Returns:
+        list | None: Cached playlist titles, or None if there is no usable cache.
+    """
+    try:
+        with open(_cache_path(machine_id), "r", encoding="utf-8") as f:
+            titles = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return titles if isinstance(titles, list) else None
+
+def save_cache(machine_id: str, titles: list) -> None:
+    """
+    Cache the playlist titles for a Plex server. Failures are ignored since the cache is only used for a quick first paint.
+
+    Args:
+        machine_id (str): The server's machineIdentifier.
+        titles (list): Playlist titles to cache.
+    """
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(_cache_path(machine_id), "w", encoding="utf-8") as f:
+            json.dump(titles, f)
+    except OSError:
+        pass
+
+def _index_path(machine_id: str) -> str:
+    """
+    Return the library index cache file path for a Plex server.
+
+    Args:
+        machine_id (str): The server's machineIdentifier.
+
+    Returns:
+        str: Path to the server's library index cache file.
+    """
+    return os.path.join(CACHE_DIR, f"{machine_id}.index.json")
+
+def load_index(machine_id: str, updated_at: float) -> dict | None:
+    """
+    Load the library index cached for a Plex server, if it was saved for the same library version.
+
+    Args:
+        machine_id (str): The server's machineIdentifier.
+        updated_at (float): The Movies section's current updatedAt timestamp.
+
+    Returns:
+        dict | None: The cached index data, or None if there is no cache or the library changed since it was saved.
+    """
+    try:
+        with open(_index_path(machine_id), "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("updated_at") != updated_at:
+        return None
+    return cached.get("index")
+
+def save_index(machine_id: str, updated_at: float, index: dict) -> None:
+    """
+    Cache the library index for a Plex server. Failures are ignored since the index can always be rebuilt.
+
+    Args:
+        machine_id (str): The server's machineIdentifier.
+        updated_at (float): The Movies section's updatedAt timestamp the index was built from.
+        index (dict): JSON-serializable index data.
+    """
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with atomic_write(_index_path(machine_id), "w", encoding="utf-8") as f:
+            json.dump({"updated_at": updated_at, "index": index}, f)
+    except OSError:
+        pass
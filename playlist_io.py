@@ -2,39 +2,184 @@ import json
 import csv
 import os
 import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from plexapi.exceptions import NotFound
+import playlist_cache
+from file_utils import atomic_write
+try:
+    import ijson
+except ImportError:  # optional; preview_import falls back to a full json parse
+    ijson = None
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the standard library json
+    orjson = None
 
-def export_to_json(server: object, playlists: list, filepath: str) -> None:
+# Concurrent lookups per playlist during import; each one may be an HTTP request to the server
+MATCH_WORKERS = 16
+# Playlists whose items are fetched concurrently during export
+EXPORT_WORKERS = 16
+# ratingKeys requested per /library/metadata call when batch-fetching import items
+RATING_KEY_BATCH = 200
+# Fields exported for each playlist item, in CSV column order
+ITEM_FIELDS = ("title", "year", "type", "imdb_id", "plex_rating_key")
+# buffer size for export and import files, so large files move in few large reads/writes
+IO_BUFFER = 1 << 20
+# attribute the Movies section is cached under on each server object, so repeated lookups don't walk the library list again
+_SECTION_ATTR = "_playlist_app_movies_section"
+
+def _dumps(obj: object, pretty: bool = False) -> str:
     """
-    Export selected Plex playlists to a JSON file.
+    Encode an object as JSON, using orjson when it is installed.
+    Output is compact unless pretty is set, in which case it is indented by two spaces.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None).decode("utf-8")
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+def _load_json_file(file_path: str) -> object:
+    """
+    Read and decode a JSON file, using orjson when it is installed.
+    """
+    # a single read() of the whole file already bypasses the buffer, so no buffering argument here
+    with open(file_path, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+def _row_tuple(item: object, _get=getattr) -> tuple:
+    """
+    Read the exported fields of one playlist item in ITEM_FIELDS order, touching each plexapi attribute once.
+
+    Args:
+        item (object): Plex media item from a playlist.
+
+    Returns:
+        tuple: The item's title, year, type, imdb_id and plex_rating_key.
+    """
+    guid = _get(item, 'guid', None)
+    # rpartition avoids building the list that split() would
+    return (item.title, _get(item, 'year', None), item.type,
+            guid.rpartition('://')[2] if guid else None, item.ratingKey)
+
+def _row(item: object) -> dict:
+    """
+    Read the exported fields of one playlist item as a dict keyed by ITEM_FIELDS.
+
+    Args:
+        item (object): Plex media item from a playlist.
+
+    Returns:
+        dict: The item's title, year, type, imdb_id and plex_rating_key.
+    """
+    return dict(zip(ITEM_FIELDS, _row_tuple(item)))
+
+def _playlist_entry(pl: object) -> dict:
+    """
+    Build the export entry (name, description, items) for one Plex playlist.
+
+    Args:
+        pl (object): Plex playlist object.
+
+    Returns:
+        dict: The playlist's entry in the export layout.
+    """
+    return {
+        "name": pl.title,
+        "description": pl.summary or "",
+        "items": [_row(item) for item in pl.items()]
+    }
+
+def _playlist_entries(playlists: list) -> list:
+    """
+    Build export entries for several playlists, fetching their items concurrently.
+
+    Args:
+        playlists (list): List of Plex playlist objects.
+
+    Returns:
+        list: Export entries in the same order as playlists.
+    """
+    if len(playlists) < 2:
+        return [_playlist_entry(pl) for pl in playlists]
+    with ThreadPoolExecutor(max_workers=min(EXPORT_WORKERS, len(playlists))) as ex:
+        return list(ex.map(_playlist_entry, playlists))
+
+def _encode_playlist_entry(pl: object, pretty: bool = False) -> str:
+    """
+    Fetch one playlist's items and encode its export entry as the JSON fragment written inside the 'playlists' array.
+
+    Args:
+        pl (object): Plex playlist object.
+        pretty (bool): Indent the entry to sit two levels deep instead of encoding it compactly.
+
+    Returns:
+        str: The encoded entry.
+    """
+    if not pretty:
+        return _dumps(_playlist_entry(pl))
+    # encoded JSON strings never contain raw newlines, so this only re-indents structure
+    return _dumps(_playlist_entry(pl), pretty=True).replace("\n", "\n    ")
+
+def export_to_dict(server: object, playlists: list) -> dict:
+    """
+    Build the export structure for the given Plex playlists without writing it to disk.
 
     Args:
         server (object): The connected Plex server instance (plexapi.server.PlexServer).
         playlists (list): List of Plex playlist objects to export.
-        filepath (str): Path to the output JSON file.
+
+    Returns:
+        dict: Export data in the same layout as the JSON export file.
     """
-    data = {
+    return {
         "export_date": datetime.datetime.now().isoformat(),
         "plex_server": server.friendlyName,
-        "playlists": []
+        "playlists": _playlist_entries(playlists)
     }
-    for pl in playlists:
-        items = []
-        for item in pl.items():
-            items.append({
-                "title": item.title,
-                "year": getattr(item, 'year', None),
-                "type": item.type,
-                "imdb_id": (item.guid.split('://')[-1] if getattr(item, 'guid', None) else None),
-                "plex_rating_key": item.ratingKey
-            })
-        data["playlists"].append({
-            "name": pl.title,
-            "description": pl.summary or "",
-            "items": items
-        })
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+
+def export_to_json(server: object, playlists: list, filepath: str, pretty: bool = False) -> None:
+    """
+    Export selected Plex playlists to a JSON file.
+
+    Args:
+        server (object): The connected Plex server instance (plexapi.server.PlexServer).
+        playlists (list): List of Plex playlist objects to export.
+        filepath (str): Path to the output JSON file.
+        pretty (bool): Indent the output by two spaces; by default it is written compactly.
+    """
+    export_date = _dumps(datetime.datetime.now().isoformat())
+    plex_server = _dumps(server.friendlyName)
+    # framing around the playlist entries: header, first/following entry prefixes, closing
+    if pretty:
+        head = f'{{\n  "export_date": {export_date},\n  "plex_server": {plex_server},\n  "playlists": ['
+        first, between, tail = "\n    ", ",\n    ", ("\n  ]\n}" if playlists else "]\n}")
+    else:
+        head = f'{{"export_date":{export_date},"plex_server":{plex_server},"playlists":['
+        first, between, tail = "", ",", "]}"
+    # atomic_write keeps a failed fetch from leaving a truncated export or clobbering an existing file.
+    # Workers fetch and encode playlists into JSON fragments while this thread writes finished
+    # fragments in playlist order. At most EXPORT_WORKERS playlists are in flight, which bounds
+    # memory. The layout matches encoding export_to_dict(...) in one go.
+    with atomic_write(filepath, "w", encoding="utf-8", buffering=IO_BUFFER) as f, \
+            ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as ex:
+        f.write(head)
+        in_flight = deque()
+        written = 0
+        def write_next():
+            nonlocal written
+            f.write(between if written else first)
+            f.write(in_flight.popleft().result())
+            written += 1
+        for pl in playlists:
+            in_flight.append(ex.submit(_encode_playlist_entry, pl, pretty))
+            if len(in_flight) >= EXPORT_WORKERS:
+                write_next()
+        while in_flight:
+            write_next()
+        f.write(tail)
 
 def export_to_csv(playlist: object, filepath: str) -> None:
     """
@@ -44,22 +189,16 @@ def export_to_csv(playlist: object, filepath: str) -> None:
         playlist (object): Plex playlist object to export.
         filepath (str): Path to the output CSV file.
     """
-    fieldnames = ["title", "year", "type", "imdb_id", "plex_rating_key"]
-    with open(filepath, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for item in playlist.items():
-            writer.writerow({
-                "title": item.title,
-                "year": getattr(item, 'year', None),
-                "type": item.type,
-                "imdb_id": (item.guid.split('://')[-1] if getattr(item, 'guid', None) else None),
-                "plex_rating_key": item.ratingKey
-            })
+    with open(filepath, "w", newline="", encoding="utf-8", buffering=IO_BUFFER) as f:
+        # fixed columns, so plain tuples avoid DictWriter's per-row dict lookups
+        writer = csv.writer(f)
+        writer.writerow(ITEM_FIELDS)
+        writer.writerows(_row_tuple(item) for item in playlist.items())
 
 def preview_import(file_path: str) -> list:
     """
     Preview playlist names from a JSON or CSV file before import.
+    For JSON, the names are streamed with ijson when it is installed, so item lists are never decoded.
 
     Args:
         file_path (str): Path to the JSON or CSV file.
@@ -69,17 +208,220 @@ def preview_import(file_path: str) -> list:
     """
     names = []
     if file_path.lower().endswith(".json"):
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if ijson is not None:
+            with open(file_path, "rb", buffering=IO_BUFFER) as f:
+                names = list(ijson.items(f, "playlists.item.name", buf_size=IO_BUFFER))
+        else:
+            data = _load_json_file(file_path)
             names = [pl["name"] for pl in data.get("playlists", [])]
     elif file_path.lower().endswith(".csv"):
         # assume single playlist; name from filename
         names = [os.path.splitext(os.path.basename(file_path))[0]]
     return names
 
+def _item_key(item: dict) -> tuple:
+    """
+    Identify an import item for de-duplicating lookups within one import.
+    """
+    return (item.get("plex_rating_key"), item.get("imdb_id"), item.get("title"), item.get("year"))
+
+def _import_items(server: object, new_name: str, items: list, results: list, missing_movies: list, progress_callback=None, cancel_event=None, get_index=None, cache: dict | None = None) -> None:
+    """
+    Match the items of one playlist against Plex and create the playlist.
+    Items with a known ratingKey are fetched in batches first; only the rest are matched like find_media_in_plex,
+    once per distinct item.
+
+    Args:
+        server (object): The connected Plex server instance.
+        new_name (str): Name of the playlist to create.
+        items (list): Item dicts to match (title, year, imdb_id, etc).
+        results (list): Summary lines; the outcome for this playlist is appended.
+        missing_movies (list): Items that could not be matched are appended here.
+        get_index (callable, optional): Returns the library index (or None); only called if some items need it.
+        cache (dict | None): Matched items (or None) keyed by _item_key, shared by all playlists of one import.
+    """
+    if cache is None:
+        cache = {}
+    total = len(items)
+    if cancel_event and cancel_event.is_set():
+        results.append(f"{new_name}: Import cancelled at 0/{total}")
+        return
+    by_rating_key = fetch_by_rating_keys(server, [item.get("plex_rating_key") for item in items])
+    # results are stored at each item's position to keep playlist order
+    found = [by_rating_key.get(str(item.get("plex_rating_key"))) for item in items] if by_rating_key else [None] * total
+    # group the remaining items so duplicates (within this playlist or already seen in this import) are looked up once
+    lookups = {}
+    for idx, media in enumerate(found):
+        if media is not None:
+            continue
+        key = _item_key(items[idx])
+        if key in cache:
+            found[idx] = cache[key]
+        else:
+            lookups.setdefault(key, []).append(idx)
+    completed = total - sum(len(idxs) for idxs in lookups.values())
+    if cancel_event and cancel_event.is_set():
+        results.append(f"{new_name}: Import cancelled at {completed}/{total}")
+        return
+    if progress_callback and completed:
+        progress_callback(completed, total)
+    index = get_index() if lookups and get_index else None
+    # a ratingKey missing from a successful batch does not exist, so don't fetch it again one by one
+    fetch_rating_key = by_rating_key is None
+    # look the remaining items up concurrently
+    with ThreadPoolExecutor(max_workers=MATCH_WORKERS) as ex:
+        futs = {ex.submit(_find_match, server, items[idxs[0]], index, fetch_rating_key): key for key, idxs in lookups.items()}
+        for fut in as_completed(futs):
+            if cancel_event and cancel_event.is_set():
+                ex.shutdown(wait=False, cancel_futures=True)
+                results.append(f"{new_name}: Import cancelled at {completed}/{total}")
+                return
+            key = futs[fut]
+            media = cache[key] = fut.result()
+            for idx in lookups[key]:
+                found[idx] = media
+            completed += len(lookups[key])
+            if progress_callback:
+                progress_callback(completed, total)
+    keys = list(lookups)
+    for key, media in zip(keys, _resolve_index_matches(server, [cache[key] for key in keys])):
+        cache[key] = media
+        for idx in lookups[key]:
+            found[idx] = media
+    matched = [media for media in found if media]
+    if cancel_event and cancel_event.is_set():
+        results.append(f"{new_name}: Import cancelled at {completed}/{total}")
+        return
+    missing_movies.extend(item for item, media in zip(items, found) if not media)
+    try:
+        server.createPlaylist(new_name, items=matched)
+    except Exception as e:
+        results.append(f"{new_name}: ERROR {e}")
+    else:
+        results.append(f"{new_name}: added {len(matched)}/{len(items)}")
+
+def fetch_by_rating_keys(server: object, rating_keys: list) -> dict | None:
+    """
+    Fetch many items by ratingKey using a few batched /library/metadata requests instead of one request per item.
+
+    Args:
+        server (object): The connected Plex server instance.
+        rating_keys (list): ratingKeys to fetch (int or str); empty and non-numeric values are ignored.
+
+    Returns:
+        dict | None: Mapping of ratingKey (as str) to Plex item for the keys that exist, or None if a batch request failed.
+    """
+    keys = list(dict.fromkeys(str(k) for k in rating_keys if k and str(k).isdigit()))
+    found = {}
+    try:
+        for start in range(0, len(keys), RATING_KEY_BATCH):
+            chunk = keys[start:start + RATING_KEY_BATCH]
+            for media in server.fetchItems(f"/library/metadata/{','.join(chunk)}"):
+                found[str(media.ratingKey)] = media
+    except Exception:
+        return None
+    return found
+
+def _read_csv_items(reader) -> list:
+    """
+    Read item dicts from a CSV export, looking the column positions up once from the header.
+    Only ITEM_FIELDS columns are kept; cells missing from short rows are None, as with csv.DictReader.
+
+    Args:
+        reader: csv.reader positioned at the header row.
+
+    Returns:
+        list: Item dicts keyed by the ITEM_FIELDS names present in the header.
+    """
+    header = next(reader, [])
+    names = [name for name in ITEM_FIELDS if name in header]
+    cols = [header.index(name) for name in names]
+    width = max(cols, default=-1) + 1
+    items = []
+    for row in reader:
+        if not row:  # blank line
+            continue
+        if len(row) < width:
+            row += [None] * (width - len(row))
+        items.append(dict(zip(names, [row[i] for i in cols])))
+    return items
+
+def _lazy_library_index(server: object):
+    """
+    Return a function that builds the server's library index on first call and returns the same index afterwards.
+
+    Args:
+        server (object): The connected Plex server instance.
+    """
+    cache = []
+    def get_index():
+        if not cache:
+            cache.append(_load_library_index(server))
+        return cache[0]
+    return get_index
+
+def _save_missing_movies(missing_movies: list) -> None:
+    """
+    Save unmatched items to 'Missing Movies.json' in the working directory, if there are any.
+
+    Args:
+        missing_movies (list): Item dicts that could not be found in Plex.
+    """
+    if missing_movies:
+        with atomic_write("Missing Movies.json", "w", encoding="utf-8", buffering=IO_BUFFER) as f:
+            f.write(_dumps(missing_movies))
+
+def load_missing_movies(file_path: str) -> list:
+    """
+    Read a 'Missing Movies.json' file written by an import.
+
+    Args:
+        file_path (str): Path to the file.
+
+    Returns:
+        list: The unmatched items, or an empty list if the file is empty or not valid JSON.
+
+    Raises:
+        OSError: If the file does not exist or cannot be read.
+    """
+    # an empty file has nothing to parse
+    if os.path.getsize(file_path) == 0:
+        return []
+    try:
+        missing = _load_json_file(file_path)
+    except ValueError:
+        return []
+    return missing if isinstance(missing, list) else []
+
+def import_from_dict(server: object, data: dict, rename_map: dict, progress_callback=None, cancel_event=None) -> str:
+    """
+    Import playlists from already-loaded export data into Plex, matching media items and handling renames.
+    Blocks on network and file I/O (including writing 'Missing Movies.json'); call it from a worker thread, not the GUI thread.
+
+    Args:
+        server (object): The connected Plex server instance.
+        data (dict): Export data in the JSON export layout (see export_to_dict).
+        rename_map (dict): Mapping of original playlist names to new names for import.
+
+    Returns:
+        str: Summary of import results for each playlist.
+    """
+    results = []
+    missing_movies = []
+    get_index = _lazy_library_index(server)
+    cache = {}
+    for pl in data.get("playlists", []):
+        original = pl["name"]
+        if original not in rename_map:
+            continue
+        _import_items(server, rename_map[original], pl.get("items", []), results, missing_movies, progress_callback, cancel_event, get_index, cache)
+    _save_missing_movies(missing_movies)
+    return "\n".join(results)
+
 def import_from_file(server: object, file_path: str, rename_map: dict, progress_callback=None, cancel_event=None) -> str:
     """
     Import playlists from a JSON or CSV file into Plex, matching media items and handling renames.
+    Blocks on network and file I/O (including writing 'Missing Movies.json'); call it from a worker thread, not the GUI thread.
 
     Args:
         server (object): The connected Plex server instance.
@@ -89,113 +431,246 @@ def import_from_file(server: object, file_path: str, rename_map: dict, progress_
     Returns:
         str: Summary of import results for each playlist.
     """
+    if file_path.lower().endswith(".json"):
+        data = _load_json_file(file_path)
+        return import_from_dict(server, data, rename_map, progress_callback, cancel_event)
     results = []
     missing_movies = []
-    if file_path.lower().endswith(".json"):
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        for pl in data.get("playlists", []):
-            original = pl["name"]
-            if original not in rename_map:
-                continue
-            new_name = rename_map[original]
-            items = pl.get("items", [])
-            matched = []
-            total = len(items)
-            for idx, item in enumerate(items):
-                if cancel_event and cancel_event.is_set():
-                    results.append(f"{new_name}: Import cancelled at {idx}/{total}")
-                    break
-                media = find_media_in_plex(server, item)
-                if media:
-                    matched.append(media)
-                else:
-                    missing_movies.append(item)
-                if progress_callback:
-                    progress_callback(idx + 1, total)
-            else:
-                try:
-                    server.createPlaylist(new_name, items=matched)
-                except Exception as e:
-                    results.append(f"{new_name}: ERROR {e}")
-                else:
-                    results.append(f"{new_name}: added {len(matched)}/{len(items)}")
-    else:
-        with open(file_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            playlist_name = os.path.splitext(os.path.basename(file_path))[0]
-            if playlist_name not in rename_map:
-                return "; ".join(results)
-            new_name = rename_map[playlist_name]
-            items = list(reader)
-            matched = []
-            total = len(items)
-            for idx, item in enumerate(items):
-                if cancel_event and cancel_event.is_set():
-                    results.append(f"{new_name}: Import cancelled at {idx}/{total}")
-                    break
-                media = find_media_in_plex(server, item)
-                if media:
-                    matched.append(media)
-                else:
-                    missing_movies.append(item)
-                if progress_callback:
-                    progress_callback(idx + 1, total)
-            else:
-                try:
-                    server.createPlaylist(new_name, items=matched)
-                except Exception as e:
-                    results.append(f"{new_name}: ERROR {e}")
-                else:
-                    results.append(f"{new_name}: added {len(matched)}/{len(items)}")
-    # Save missing movies to JSON if any
-    if missing_movies:
-        with open("Missing Movies.json", "w", encoding="utf-8") as f:
-            json.dump(missing_movies, f, indent=2)
+    with open(file_path, "r", encoding="utf-8", buffering=IO_BUFFER) as f:
+        reader = csv.reader(f)
+        playlist_name = os.path.splitext(os.path.basename(file_path))[0]
+        if playlist_name not in rename_map:
+            return "; ".join(results)
+        items = _read_csv_items(reader)
+    _import_items(server, rename_map[playlist_name], items, results, missing_movies, progress_callback, cancel_event, _lazy_library_index(server))
+    _save_missing_movies(missing_movies)
     return "\n".join(results)
 
+def _normalize_title(title: str | None) -> str:
+    """
+    Normalize a title for index lookups (trimmed and case-folded).
+    """
+    return (title or "").strip().casefold()
+
+def _guid_key(guid: str | None) -> str | None:
+    """
+    Reduce a guid or exported imdb_id to the id part used as an index key, e.g. 'com.plexapp.agents.imdb://tt0011870?lang=en' -> 'tt0011870'.
+    """
+    if not guid:
+        return None
+    return guid.split('://')[-1].split('?')[0]
+
+def _year_key(year) -> int | None:
+    """
+    Convert a year from JSON (int) or CSV (str) to an int, or None if it is missing or invalid.
+    """
+    try:
+        return int(year)
+    except (TypeError, ValueError):
+        return None
+
+def _media_guid_keys(media: object) -> set:
+    """
+    Collect the guid ids of a Plex item: its primary guid plus any external ids (e.g. imdb://tt0078748 -> 'tt0078748').
+    """
+    keys = {_guid_key(getattr(media, 'guid', None))}
+    # read guids from the instance dict so an empty list doesn't make plexapi reload the item over the network
+    keys.update(_guid_key(g.id) for g in (vars(media).get('guids') or ()))
+    keys.discard(None)
+    return keys
+
+def build_library_index(movies_section: object) -> dict:
+    """
+    Fetch every item in a library section once and index it for in-memory matching.
+
+    Args:
+        movies_section (object): Plex library section to index (usually 'Movies').
+
+    Returns:
+        dict: Lookup tables 'by_guid' (primary or external guid id -> item), 'by_title_year' ((title, year) -> items)
+            and 'by_title' (title -> items). Titles are normalized with _normalize_title.
+    """
+    by_guid = {}
+    by_title_year = {}
+    by_title = {}
+    for media in movies_section.all():
+        for key in _media_guid_keys(media):
+            by_guid.setdefault(key, media)
+        title = _normalize_title(media.title)
+        year = _year_key(getattr(media, 'year', None))
+        if year is not None:
+            by_title_year.setdefault((title, year), []).append(media)
+        by_title.setdefault(title, []).append(media)
+    return {"by_guid": by_guid, "by_title_year": by_title_year, "by_title": by_title}
+
+def _movies_section(server: object) -> object:
+    """
+    Return the server's Movies section, loading it on first use and reusing it afterwards.
+
+    Args:
+        server (object): The connected Plex server instance.
+
+    Returns:
+        object: The 'Movies' library section. Raises whatever server.library.section raises if it cannot be loaded.
+    """
+    section = getattr(server, _SECTION_ATTR, None)
+    if section is None:
+        section = server.library.section('Movies')
+        setattr(server, _SECTION_ATTR, section)
+    return section
+
+def _index_to_rating_keys(index: dict) -> dict:
+    """
+    Convert a library index to JSON-serializable form for the on-disk cache, with each item replaced by its ratingKey.
+    """
+    def keys(items):
+        return [str(media.ratingKey) for media in items]
+    return {
+        "by_guid": {guid: str(media.ratingKey) for guid, media in index["by_guid"].items()},
+        "by_title_year": [[title, year, keys(items)] for (title, year), items in index["by_title_year"].items()],
+        "by_title": {title: keys(items) for title, items in index["by_title"].items()},
+    }
+
+def _index_from_rating_keys(data: dict) -> dict | None:
+    """
+    Rebuild a library index from its on-disk cache form. Lookups return ratingKeys (str) instead of items.
+    Returns None if the data is malformed.
+    """
+    try:
+        return {
+            "by_guid": dict(data["by_guid"]),
+            "by_title_year": {(title, year): keys for title, year, keys in data["by_title_year"]},
+            "by_title": dict(data["by_title"]),
+        }
+    except (KeyError, TypeError, ValueError):
+        return None
+
+def _movies_updated_at(server: object) -> float | None:
+    """
+    Return when the server's Movies section last changed, read fresh from the server rather than from _movies_section.
+    """
+    for section in server.library.sections():
+        if section.title == 'Movies':
+            updated_at = getattr(section, 'updatedAt', None)
+            return updated_at.timestamp() if updated_at else None
+    return None
+
+def _load_library_index(server: object) -> dict | None:
+    """
+    Load the library index for the server's Movies section.
+    The index is cached on disk per server and reused while the section's updatedAt is unchanged;
+    otherwise it is rebuilt from the whole section and the cache is refreshed.
+
+    Args:
+        server (object): The connected Plex server instance.
+
+    Returns:
+        dict | None: Library index, or None if the section could not be loaded.
+            A cached index maps to ratingKeys (str) instead of items.
+    """
+    try:
+        machine_id = server.machineIdentifier
+        updated_at = _movies_updated_at(server)
+        if updated_at is not None:
+            cached = playlist_cache.load_index(machine_id, updated_at)
+            index = _index_from_rating_keys(cached) if cached is not None else None
+            if index is not None:
+                return index
+        index = build_library_index(_movies_section(server))
+    except Exception:
+        return None
+    if updated_at is not None:
+        playlist_cache.save_index(machine_id, updated_at, _index_to_rating_keys(index))
+    return index
+
+def _resolve_index_matches(server: object, matches: list) -> list:
+    """
+    Replace the ratingKeys (str) that a cached index matches with their Plex items; other entries are kept.
+    Keys are fetched in batches, falling back to one request per key if a batch fails.
 
-def find_media_in_plex(server: object, item: dict) -> object | None:
+    Args:
+        server (object): The connected Plex server instance.
+        matches (list): Results of _find_match.
+
+    Returns:
+        list: The matches in the same order, each a Plex item or None if it could not be fetched.
+    """
+    keys = [media for media in matches if isinstance(media, str)]
+    if not keys:
+        return matches
+    fetched = fetch_by_rating_keys(server, keys)
+    if fetched is None:
+        fetched = {}
+        for key in set(keys):
+            try:
+                fetched[key] = server.fetchItem(int(key))
+            except Exception:
+                pass
+    return [fetched.get(media) if isinstance(media, str) else media for media in matches]
+
+def find_media_in_plex(server: object, item: dict, index: dict | None = None, fetch_rating_key: bool = True) -> object | None:
     """
     Attempt to find a matching media item in Plex for a given item dict.
     Tries rating key, then IMDB ID, then title+year, then title only.
+    With an index from build_library_index or _load_library_index, everything after the rating key is an in-memory lookup.
 
     Args:
         server (object): The connected Plex server instance.
         item (dict): Dictionary describing the media item (title, year, imdb_id, etc).
+        index (dict | None): Library index. Without it, the Movies section is searched.
+        fetch_rating_key (bool): Try server.fetchItem with the item's ratingKey first. Default is True.
 
     Returns:
         object | None: The matched Plex media item, or None if not found.
     """
+    return _resolve_index_matches(server, [_find_match(server, item, index, fetch_rating_key)])[0]
+
+def _find_match(server: object, item: dict, index: dict | None, fetch_rating_key: bool) -> object | str | None:
+    """
+    Match one item as described for find_media_in_plex, without fetching the items a cached index refers to.
+
+    Returns:
+        object | str | None: The matched Plex item, its ratingKey (str) if it came from an index loaded
+            from the on-disk cache (see _resolve_index_matches), or None if not found.
+    """
     # Try matching by plex rating key
-    if item.get("plex_rating_key"):
+    if fetch_rating_key and item.get("plex_rating_key"):
         try:
             return server.fetchItem(item["plex_rating_key"])
         except Exception:
             pass
+    if index is not None:
+        media = index["by_guid"].get(_guid_key(item.get("imdb_id")))
+        if media is not None:
+            return media
+        title = _normalize_title(item.get("title"))
+        year = _year_key(item.get("year"))
+        matches = index["by_title_year"].get((title, year)) if year is not None else None
+        if not matches:
+            matches = index["by_title"].get(title)
+        return matches[0] if matches else None
     # Use Movies section for searching
     try:
-        movies_section = server.library.section('Movies')
+        movies_section = _movies_section(server)
     except Exception:
         return None
+    # Each search is issued at most once and reused by the later steps
+    year_results = movies_section.search(title=item["title"], year=item["year"]) if item.get("year") else None
+    title_results = None
     # Try by external IDs (IMDB)
     if item.get("imdb_id"):
-        imdb_id = item["imdb_id"]
+        imdb_key = _guid_key(item["imdb_id"])
         # Search by title and year if available, else by title
-        if item.get("year"):
-            results = movies_section.search(title=item["title"], year=item["year"])
-        else:
-            results = movies_section.search(title=item["title"])
-        # Filter results by IMDB ID in guid
-        for result in results:
-            guid = getattr(result, 'guid', '')
-            if imdb_id in guid:
+        if year_results is None:
+            title_results = movies_section.search(title=item["title"])
+        # Filter results by IMDB ID among each result's guids
+        for result in (year_results if year_results is not None else title_results):
+            if imdb_key in _media_guid_keys(result):
                 return result
     # Try by title and year
-    if item.get("year"):
-        results = movies_section.search(title=item["title"], year=item["year"])
-        if results:
-            return results[0]
+    if year_results:
+        return year_results[0]
     # Fallback to title only
-    results = movies_section.search(title=item["title"])
-    return results[0] if results else None
+    if title_results is None:
+        title_results = movies_section.search(title=item["title"])
+    return title_results[0] if title_results else None
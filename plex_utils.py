@@ -1,12 +1,13 @@
 import webbrowser
 from plexapi.myplex import MyPlexAccount, MyPlexPinLogin
 
-def login_to_plex(timeout: int = 120) -> object:
+def login_to_plex(timeout: int = 120, cancel_event=None) -> object:
     """
     Log in to Plex via pin and return a connected server instance.
 
     Args:
         timeout (int): Maximum time to wait for login (seconds). Default is 120.
+        cancel_event (threading.Event, optional): Stops waiting for the login when set.
 
     Returns:
         object: Connected Plex server instance (plexapi.server.PlexServer).
@@ -21,6 +22,12 @@ def login_to_plex(timeout: int = 120) -> object:
     pinlogin = MyPlexPinLogin(headers=headers, oauth=True)
     webbrowser.open(pinlogin.oauthUrl())
     pinlogin.run(timeout=timeout)
+    if cancel_event is not None:
+        # poll so a cancel (e.g. the app closing) doesn't have to wait out the timeout
+        while not pinlogin.finished:
+            if cancel_event.wait(0.5):
+                pinlogin.stop()
+                raise Exception("Plex login cancelled.")
     pinlogin.waitForLogin()
     if not pinlogin.token:
         raise Exception("Plex login failed.")